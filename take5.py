@@ -1,37 +1,39 @@
 from abc import ABC
-from random import shuffle, choice, randrange
-from math import exp
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from multiprocessing import Pool, cpu_count
+from random import shuffle, choice, randrange, seed as seed_random
+from math import exp, inf
+
+NR_CARDS = 104
+
+# points per card value, indexed by the card itself (index 0 is unused):
+# 1 by default, +1 for multiples of 5, +1 more for multiples of 10, +4 for multiples of 11, 7 for 55
+_POINTS = tuple(1 + (c % 5 == 0) + (c % 10 == 0) + 4 * (c % 11 == 0) + (c == 55) for c in range(NR_CARDS + 1))
+
+TurnStats = namedtuple("TurnStats", ["min_points", "min_points_idx", "min_length", "min_length_idx"])
 
 class CardTooLowException(Exception):
     pass
 
-class Card(int):
-    @property
-    def points(self):
-        if self == 55:
-            return 7
-        elif self in [11, 22, 33, 44, 66, 77, 88, 99]:
-            return 5
-        elif self in [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]:
-            return 3
-        elif self in [5, 15, 25, 35, 45, 65, 75, 85, 95]:
-            return 2
-        else:
-            return 1
+def card_points(card : int) -> int:
+    """Returns the points of a single card, replacing the former Card.points for custom bots"""
+    return _POINTS[card]
 
 class Row:
     CARD_LIMIT = 5
+    __slots__ = ("cards", "_points", "head", "length")
 
     def __init__(self) -> None:
         self.cards = []
+        self._points = 0
+        # kept in sync with self.cards by add_card and clear
+        self.head = None
+        self.length = 0
 
     def __repr__(self) -> str:
         return " ".join([f"{c:3}" for c in self.cards])
     
-    @property
-    def length(self):
-        return len(self.cards)
-    
     @property
     def empty(self) -> bool:
         return self.length == 0
@@ -40,40 +42,52 @@ class Row:
     def full(self) -> bool:
         return self.length >= self.CARD_LIMIT
     
-    @property
-    def head(self) -> Card:
-        return self.cards[-1] if not self.empty else None
-        
     @property
     def points(self) -> int:
-        return sum([card.points for card in self.cards])
+        return self._points
     
-    def clear(self, new_card : Card = None) -> int:
-        pts = self.points
+    def clear(self, new_card : int = None) -> int:
+        pts = self._points
+        # the card list is reused rather than replaced, rows live for the whole game
+        self.cards.clear()
         if new_card:
-            self.cards = [new_card]
+            self.cards.append(new_card)
+            self._points = _POINTS[new_card]
+            self.head = new_card
+            self.length = 1
         else:
-            self.cards = []
+            self._points = 0
+            self.head = None
+            self.length = 0
         return pts
     
-    def add_card(self, card : Card) -> int:
+    def add_card(self, card : int) -> int:
         """
         Returns the number of points for the player if the row was full, otherwise zero
         """
-        if not self.empty and card <= self.head:
+        if self.length and card <= self.head:
             raise CardTooLowException()
         if self.full:
             pts = self.clear()
         else:
             pts = 0
         self.cards.append(card)
+        self._points += _POINTS[card]
+        self.head = card
+        self.length += 1
         return pts
         
 class Board:
     NR_ROWS = 4
+    __slots__ = ("rows", "_snapshot", "_turn_stats", "_heads_mask", "_head_rows")
 
     def __init__(self) -> None:
         self.rows = [Row() for _ in range(self.NR_ROWS)]
+        self._snapshot = None
+        self._turn_stats = None
+        # bit h is set for every row head h, mapped back to its row by _head_rows
+        self._heads_mask = 0
+        self._head_rows = {}
 
     def __repr__(self) -> str:
         return "\n".join([str(r) for r in self.rows])
@@ -83,37 +97,90 @@ class Board:
             yield row
 
     def clear(self):
+        self._snapshot = None
+        self._turn_stats = None
+        self._heads_mask = 0
+        self._head_rows.clear()
         for row in self.rows:
             row.clear()
+
+    def snapshot(self) -> tuple[tuple, tuple, tuple]:
+        """
+        Returns the heads, lengths and points of all rows, cached until the board changes
+        """
+        if self._snapshot is None:
+            self._snapshot = (
+                tuple(r.head for r in self.rows),
+                tuple(r.length for r in self.rows),
+                tuple(r._points for r in self.rows),
+            )
+        return self._snapshot
+
+    def turn_stats(self) -> TurnStats:
+        """
+        Returns the lowest row points and row length with their row indices, cached until the board changes
+        """
+        if self._turn_stats is None:
+            _, lengths, points = self.snapshot()
+            min_points = min(points)
+            min_length = min(lengths)
+            self._turn_stats = TurnStats(min_points, points.index(min_points), min_length, lengths.index(min_length))
+        return self._turn_stats
+
+    def highest_below(self, card : int) -> tuple[int, int]:
+        """
+        Returns the row index and value of the highest head lower than card, or (-1, -1) if there is none
+        """
+        below = self._heads_mask & ((1 << card) - 1)
+        if not below:
+            return -1, -1
+        head = below.bit_length() - 1
+        return self._head_rows[head], head
+
+    def _move_head(self, row_index : int, old_head : int, new_head : int):
+        if old_head is not None:
+            self._heads_mask ^= 1 << old_head
+            del self._head_rows[old_head]
+        if new_head is not None:
+            self._heads_mask |= 1 << new_head
+            self._head_rows[new_head] = row_index
     
-    def play_card(self, card : Card) -> int:
+    def play_card(self, card : int) -> int:
         """
         Returns:
             -1 if card is lower than any rows -> player can choose which row to take
              p otherwise, p being the number of points for the player
         """
+        self._snapshot = None
+        self._turn_stats = None
         # if any row is empty, card is played there
-        for row in self.rows:
+        for row_index, row in enumerate(self.rows):
             if row.empty:
+                self._move_head(row_index, None, card)
                 return row.add_card(card)
-        heads = [r.head for r in self.rows]
+        # find highest head lower than played card
+        row_index, head = self.highest_below(card)
         # check if played card lower than any heads
-        if not any([i < card for i in heads]):
+        if row_index < 0:
             return -1
-        # find highest head lower than played card
-        head = max(i for i in heads if i < card)
-        row_index = heads.index(head)
+        self._move_head(row_index, head, card)
         return self.rows[row_index].add_card(card)
 
-    def clear_row(self, row_index : int, new_card : Card) -> int:
+    def clear_row(self, row_index : int, new_card : int) -> int:
+        self._snapshot = None
+        self._turn_stats = None
+        self._move_head(row_index, self.rows[row_index].head, new_card)
         return self.rows[row_index].clear(new_card)
 
 class Player(ABC):
+    # subclasses without their own __slots__ (e.g. custom bots) still get a __dict__
+    __slots__ = ("id", "points", "hand")
+
     def __init__(self, id) -> None:
         self.id = id
         self.points = 0
 
-    def receive_hand(self, hand : list[Card]):
+    def receive_hand(self, hand : list[int]):
         self.hand = hand
 
     def add_points(self, points : int):
@@ -122,7 +189,7 @@ class Player(ABC):
     def clear_points(self):
         self.points = 0
 
-    def choose_card(self, board : Board) -> Card:
+    def choose_card(self, board : Board) -> int:
         """Returns a card"""
         raise NotImplementedError()
     
@@ -131,14 +198,16 @@ class Player(ABC):
         raise NotImplementedError()
 
 class ManualPlayer(Player):
-    def choose_card(self, board : Board) -> Card:
+    __slots__ = ()
+
+    def choose_card(self, board : Board) -> int:
         print(f"Player '{self.id}' has to choose a card to play")
         print(f"Hand: {sorted(self.hand)}")
         card = None
         while card not in self.hand:
             card_input = input("Card to play: ")
             try:
-                card = Card(card_input)
+                card = int(card_input)
             except:
                 continue
         self.hand.remove(card)
@@ -158,65 +227,85 @@ class ManualPlayer(Player):
         return row - 1
     
 class MinimumRowPointPlayer(Player):
+    __slots__ = ()
+
     def choose_row(self, board : Board) -> int:
         """Choose the row with lowest number of points"""
-        row_points = [row.points for row in board]
-        return row_points.index(min(row_points))
+        return board.turn_stats().min_points_idx
     
 class RandomPlayer(MinimumRowPointPlayer):
-    def choose_card(self, board : Board) -> Card:
+    __slots__ = ()
+
+    def choose_card(self, board : Board) -> int:
         """Pick a random card"""
         card = self.hand.pop(randrange(len(self.hand)))
         return card
     
 class AscendingPlayer(MinimumRowPointPlayer):
-    def choose_card(self, board : Board) -> Card:
-        """Pick the lowest card available"""
+    __slots__ = ()
+
+    def receive_hand(self, hand : list[int]):
+        super().receive_hand(hand)
         self.hand.sort(reverse=True)
-        card = self.hand.pop()
-        return card
+
+    def choose_card(self, board : Board) -> int:
+        """Pick the lowest card available"""
+        return self.hand.pop()
     
 class DescendingPlayer(MinimumRowPointPlayer):
-    def choose_card(self, board : Board) -> Card:
-        """Pick the highest card available"""
+    __slots__ = ()
+
+    def receive_hand(self, hand : list[int]):
+        super().receive_hand(hand)
         self.hand.sort()
-        card = self.hand.pop()
-        return card
+
+    def choose_card(self, board : Board) -> int:
+        """Pick the highest card available"""
+        return self.hand.pop()
     
 class SmallestGapPlayer(MinimumRowPointPlayer):
-    def choose_card(self, board : Board) -> Card:
+    __slots__ = ()
+
+    def choose_card(self, board : Board) -> int:
         """Pick the card with the smallest gap to a not-full row head"""
-        heads = [row.head for row in board if not row.full]
+        heads, lengths, _ = board.snapshot()
+        hand = sorted(self.hand)
         best_card_so_far = self.hand[0]
         smallest_gap_so_far = 1000
-        for card in self.hand:
-            # try to avoid picking card lower than any heads
-            if not any([head < card for head in heads]):
+        # the smallest gap to a head always comes from the lowest card above it,
+        # so only one card per open head has to be considered
+        for head, length in zip(heads, lengths):
+            if length >= Row.CARD_LIMIT:
                 continue
-            # find highest head lower than played card
-            head = max([i for i in heads if i < card])
+            pos = bisect_right(hand, head)
+            # no card above this head
+            if pos == len(hand):
+                continue
+            card = hand[pos]
             gap  = card - head
-            if gap < smallest_gap_so_far:
+            # on equal gaps keep the card that comes first in the hand
+            if gap < smallest_gap_so_far or (gap == smallest_gap_so_far and
+                                             self.hand.index(card) < self.hand.index(best_card_so_far)):
                 best_card_so_far = card
                 smallest_gap_so_far = gap
         self.hand.remove(best_card_so_far)
         return best_card_so_far
 
 class ShortestRowPlayer(MinimumRowPointPlayer):
-    def choose_card(self, board : Board) -> Card:
+    __slots__ = ()
+
+    def choose_card(self, board : Board) -> int:
         """Pick the lowest card for the shortest row, with gap as tiebreaker"""
-        heads = [row.head for row in board]
-        lengths = [row.length for row in board]
+        _, lengths, _ = board.snapshot()
         best_card_so_far = self.hand[0]
         shortest_length_so_far = 6
         best_card_gap_so_far = 105
         for card in self.hand:
+            # find highest head lower than played card
+            index, head = board.highest_below(card)
             # try to avoid picking card lower than any heads
-            if not any([head < card for head in heads]):
+            if index < 0:
                 continue
-            # find highest head lower than played card
-            head = max([i for i in heads if i < card])
-            index = heads.index(head)
             length = lengths[index]
             gap  = card - head
             if length < shortest_length_so_far or (length == shortest_length_so_far and gap < best_card_gap_so_far):
@@ -226,55 +315,223 @@ class ShortestRowPlayer(MinimumRowPointPlayer):
         self.hand.remove(best_card_so_far)
         return best_card_so_far
     
-class CostFunPlayer(MinimumRowPointPlayer):
-    def __init__(self, id, num_players : int, alpha : float = 0.3) -> None:
-        super().__init__(id)
-        self.num_players = num_players
-        self.alpha = alpha
+def gap_chances(alpha : float) -> tuple:
+    """
+    Returns, per gap size, the chance that the gap to a row head gets filled by other players
+    """
+    # gaps between two cards range from 1 to NR_CARDS - 1
+    return tuple(1 - exp(-alpha * (gap - 1)) if gap >= 1 else 0.0 for gap in range(NR_CARDS))
+
+def _sort_heads(heads) -> tuple[list, list]:
+    """
+    Returns the heads of a board snapshot in ascending order, and the row index of each
+    """
+    order = sorted(range(len(heads)), key=heads.__getitem__)
+    return [heads[i] for i in order], order
 
-    def choose_card(self, board: Board) -> Card:
-        heads = [row.head for row in board]
-        lengths = [row.length for row in board]
-        points = [row.points for row in board]
-
-        def cost_fun(card : Card) -> float:
-            if not any([head < card for head in heads]):
-                # have to take a row, assuming min points row
-                #TODO: differentiate within these cards
-                cost = min(points)
-                return cost
-            head = max([i for i in heads if i < card])
-            index = heads.index(head)
+def _row_below(sorted_heads : list, order : list, card : int) -> int:
+    """
+    Returns the row index of the highest head lower than card, or -1 if there is none.
+    This is the lookup for board snapshots; live boards use Board.highest_below
+    """
+    pos = bisect_left(sorted_heads, card) - 1
+    return order[pos] if pos >= 0 else -1
+
+def card_costs(hand : list[int], heads : tuple, lengths : tuple, points : tuple, min_points : int,
+               num_players : int, gap_chance : tuple, limit : int) -> list[float]:
+    """
+    Returns the estimated cost of having to take a row for every card in hand
+    """
+    sorted_heads, order = _sort_heads(heads)
+    costs = []
+    for card in hand:
+        index = _row_below(sorted_heads, order, card)
+        if index < 0:
+            # have to take a row, assuming min points row
+            #TODO: differentiate within these cards
+            cost = min_points
+        else:
             length = lengths[index]
-            gap  = card - head
+            gap  = card - heads[index]
             pts = points[index]
-            limit = board.rows[index].CARD_LIMIT
             cards_before_limit = limit - length
             if cards_before_limit == 0:
                 est_chance_of_taking = 1.0
-            elif self.num_players <= cards_before_limit or gap == 1:
+            elif num_players <= cards_before_limit or gap == 1:
                 est_chance_of_taking = 0.0
             else:
-                space_chance = 1.0 - cards_before_limit / self.num_players
-                gap_chance = 1 - exp(-self.alpha * (gap - 1))
-                est_chance_of_taking = space_chance * gap_chance
+                space_chance = 1.0 - cards_before_limit / num_players
+                est_chance_of_taking = space_chance * gap_chance[gap]
             cost = pts * est_chance_of_taking
-            return cost
-        
-        best_value_so_far = 0.0
-        best_card_so_far = None
+        costs.append(cost)
+    return costs
+
+def choose_cost_card(hand : list[int], heads : tuple, lengths : tuple, points : tuple, min_points : int,
+                     num_players : int, gap_chance : tuple, limit : int) -> int:
+    """
+    Returns the card from hand with the lowest estimated cost of having to take a row
+    """
+    best_value_so_far = 0.0
+    best_card_so_far = None
+    costs = card_costs(hand, heads, lengths, points, min_points, num_players, gap_chance, limit)
+    for card, cost in zip(hand, costs):
+        value = 1 / (cost + 0.001)
+        if value > best_value_so_far:
+            best_value_so_far = value
+            best_card_so_far = card
+    return best_card_so_far
+
+class CostFunPlayer(MinimumRowPointPlayer):
+    __slots__ = ("num_players", "alpha", "_gap_chance")
+
+    def __init__(self, id, num_players : int, alpha : float = 0.3) -> None:
+        super().__init__(id)
+        self.num_players = num_players
+        self.alpha = alpha
+        self._gap_chance = gap_chances(alpha)
+
+    def choose_card(self, board: Board) -> int:
+        heads, lengths, points = board.snapshot()
+        min_points = board.turn_stats().min_points
+        card = choose_cost_card(self.hand, heads, lengths, points, min_points,
+                                self.num_players, self._gap_chance, Row.CARD_LIMIT)
+        self.hand.remove(card)
+        return card
+
+def _cards_in(mask : int):
+    """Yields the cards whose bits are set in mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def _place_card(heads : list, lengths : list, points : list, card : int) -> int:
+    """
+    Plays card on rows given as lists, taking the lowest point row if the card is too low.
+    Returns the number of points taken
+    """
+    sorted_heads, order = _sort_heads(heads)
+    index = _row_below(sorted_heads, order, card)
+    if index < 0:
+        index = points.index(min(points))
+    elif lengths[index] < Row.CARD_LIMIT:
+        heads[index] = card
+        lengths[index] += 1
+        points[index] += _POINTS[card]
+        return 0
+    taken = points[index]
+    heads[index] = card
+    lengths[index] = 1
+    points[index] = _POINTS[card]
+    return taken
+
+def _resolve_turn(rows : tuple, card : int, other_card : int) -> tuple[tuple, int]:
+    """
+    Plays card and other_card on a board snapshot, lowest card first.
+    Returns the new snapshot and the points taken by other_card minus those taken by card
+    """
+    heads, lengths, points = list(rows[0]), list(rows[1]), list(rows[2])
+    if card < other_card:
+        mine = _place_card(heads, lengths, points, card)
+        theirs = _place_card(heads, lengths, points, other_card)
+    else:
+        theirs = _place_card(heads, lengths, points, other_card)
+        mine = _place_card(heads, lengths, points, card)
+    return (tuple(heads), tuple(lengths), tuple(points)), theirs - mine
+
+class LookaheadPlayer(MinimumRowPointPlayer):
+    """
+    Searches the coming turns with alpha-beta pruning. The other players are modelled as a
+    single adversary that can answer with any card not in hand or on the board, and scores
+    are the points the adversary takes minus the points this player takes.
+    """
+    __slots__ = ("num_players", "depth", "_gap_chance")
+
+    # bits 1 up to and including NR_CARDS, one per card
+    ALL_CARDS = (1 << (NR_CARDS + 1)) - 2
+
+    def __init__(self, id, num_players : int, depth : int = 1, alpha : float = 0.3) -> None:
+        super().__init__(id)
+        if depth < 1:
+            raise ValueError("Lookahead depth must be at least 1")
+        self.num_players = num_players
+        self.depth = depth
+        # only used to order the moves, see _ordered_moves
+        self._gap_chance = gap_chances(alpha)
+
+    def choose_card(self, board : Board) -> int:
+        """Pick the card with the best worst-case points difference over the next turns"""
+        seen = 0
         for card in self.hand:
-            value = 1 / (cost_fun(card) + 0.001)
+            seen |= 1 << card
+        for row in board:
+            for card in row.cards:
+                seen |= 1 << card
+        unseen = self.ALL_CARDS & ~seen
+        rows = board.snapshot()
+        best_value_so_far = -inf
+        best_card_so_far = None
+        for card, rest in self._ordered_moves(rows, tuple(self.hand)):
+            value = self._min_value(rows, rest, card, unseen, self.depth, best_value_so_far, inf)
             if value > best_value_so_far:
                 best_value_so_far = value
                 best_card_so_far = card
         self.hand.remove(best_card_so_far)
         return best_card_so_far
 
+    def _ordered_moves(self, rows : tuple, hand : tuple) -> list[tuple[int, tuple]]:
+        """
+        Returns (card, remaining hand) pairs, cheapest card by CostFunPlayer's cost first,
+        so that good moves raise alpha early and later moves get pruned
+        """
+        heads, lengths, points = rows
+        costs = card_costs(hand, heads, lengths, points, min(points),
+                           self.num_players, self._gap_chance, Row.CARD_LIMIT)
+        order = sorted(range(len(hand)), key=costs.__getitem__)
+        return [(hand[i], hand[:i] + hand[i + 1:]) for i in order]
+
+    def _max_value(self, rows : tuple, hand : tuple, unseen : int, depth : int, alpha : float, beta : float) -> float:
+        if depth == 0 or not hand:
+            return 0
+        value = -inf
+        for card, rest in self._ordered_moves(rows, hand):
+            value = max(value, self._min_value(rows, rest, card, unseen, depth, alpha, beta))
+            if value >= beta:
+                return value
+            alpha = max(alpha, value)
+        return value
+
+    def _min_value(self, rows : tuple, hand : tuple, card : int, unseen : int, depth : int,
+                   alpha : float, beta : float) -> float:
+        if depth == 1:
+            # last turn of the search: the score is just the points difference of this turn
+            value = inf
+            for other_card in _cards_in(unseen):
+                _, diff = _resolve_turn(rows, card, other_card)
+                if diff < value:
+                    value = diff
+                    if value <= alpha:
+                        return value
+            return value
+        # try the replies that hurt us most in this turn first
+        replies = []
+        for other_card in _cards_in(unseen):
+            new_rows, diff = _resolve_turn(rows, card, other_card)
+            replies.append((diff, other_card, new_rows))
+        replies.sort(key=lambda reply: reply[0])
+        value = inf
+        for diff, other_card, new_rows in replies:
+            # the child is searched relative to the points difference of this turn
+            value = min(value, diff + self._max_value(new_rows, hand, unseen ^ (1 << other_card),
+                                                      depth - 1, alpha - diff, beta - diff))
+            if value <= alpha:
+                return value
+            beta = min(beta, value)
+        return value
 
 class Take5:
     NR_TURNS = 10
-    NR_CARDS = 104
+    NR_CARDS = NR_CARDS
     def __init__(self, players : list[Player], quiet : bool = False) -> None:
         self.players = players
         self.num_players = len(players)
@@ -284,55 +541,97 @@ class Take5:
         if any([isinstance(player, ManualPlayer) for player in players]) and quiet:
             raise ValueError("Can't play in quiet mode if manual players are playing")
         self.quiet = quiet
+        # the deck is created once and reshuffled in place every round
+        self._deck = list(range(1, self.NR_CARDS + 1))
 
     def deal(self):
         self.board.clear()
-        deck = [Card(i) for i in range(1, self.NR_CARDS + 1)]
+        deck = self._deck
         shuffle(deck)
-        for player in self.players:
-            deck, hand = deck[:-self.NR_TURNS], deck[-self.NR_TURNS:]
-            player.receive_hand(hand)
-        for row in self.board:
-            row.add_card(deck.pop())
-
-    def print(self, s):
-        if not self.quiet:
-            print(s)
+        for i, player in enumerate(self.players):
+            player.receive_hand(deck[i * self.NR_TURNS:(i + 1) * self.NR_TURNS])
+        for i in range(1, self.board.NR_ROWS + 1):
+            self.board.play_card(deck[-i])
 
-    def round(self):
-        self.print("\n\nNEW ROUND")
+    def round(self) -> list[int]:
+        """
+        Plays one round and returns the points of each player, in the order of self.players
+        """
+        # output is guarded explicitly so quiet mode doesn't format any f-strings
+        verbose = not self.quiet
+        if verbose:
+            print("\n\nNEW ROUND")
         self.deal()
 
         for i in range(self.NR_TURNS):
-            self.print("\n-----------------")
-            self.print(f"Turn {i + 1}")
-            self.print("-----------------")
-            self.print(self.board)
-            played_cards = dict()
-            for player in self.players:
-                played_cards[player] = player.choose_card(self.board)
-                card_players = {card : player for player, card in played_cards.items()}
-            played_cards = list(played_cards.values())
-            played_cards.sort()
-            for card in played_cards:
-                player = card_players[card]
-                self.print(f"Player {player.id} plays {card}")
+            if verbose:
+                print("\n-----------------")
+                print(f"Turn {i + 1}")
+                print("-----------------")
+                print(self.board)
+            players = self.players
+            plays = [(player.choose_card(self.board), player_index)
+                     for player_index, player in enumerate(players)]
+            plays.sort()
+            for card, player_index in plays:
+                player = players[player_index]
+                if verbose:
+                    print(f"Player {player.id} plays {card}")
                 points = self.board.play_card(card)
                 if points == -1:
-                    self.print(f"Player {player.id} has to choose a row to take")
+                    if verbose:
+                        print(f"Player {player.id} has to choose a row to take")
                     row_index = player.choose_row(self.board)
-                    self.print(f"Player {player.id} takes row {row_index + 1}")
+                    if verbose:
+                        print(f"Player {player.id} takes row {row_index + 1}")
                     points = self.board.clear_row(row_index, card)
-                if points != 0:
-                    self.print(f"Player {player.id} receives {points} points")
+                if verbose and points != 0:
+                    print(f"Player {player.id} receives {points} points")
                 player.add_points(points)
-                self.print(self.board)
-            self.print("-----------------")
+                if verbose:
+                    print(self.board)
+            if verbose:
+                print("-----------------")
         
-        self.print("Round results:")
+        if verbose:
+            print("Round results:")
+            for player in self.players:
+                print(f"Player {player.id}: {player.points}")
+        results = [player.points for player in self.players]
         for player in self.players:
-            self.print(f"Player {player.id}: {player.points}")
-        return {player.id: player.points for player in self.players}
+            player.clear_points()
+        return results
+
+    def tournament(self, nr_rounds : int, processes : int = 1, seed : int = None) -> dict:
+        """
+        Plays a number of rounds and returns the point totals per player id.
+        Rounds are independent, so with processes > 1 they are split over worker
+        processes that each play on their own copy of the game.
+        """
+        if processes > 1:
+            if not self.quiet:
+                raise ValueError("Can't play in parallel unless in quiet mode")
+            chunks = [nr_rounds // processes + (i < nr_rounds % processes) for i in range(processes)]
+            # every worker gets its own seed, otherwise forked workers share the random state
+            seeds = [None if seed is None else seed + i for i in range(processes)]
+            with Pool(processes) as pool:
+                results = pool.starmap(_play_rounds, [(self, n, s) for n, s in zip(chunks, seeds)])
+            return {player.id: sum(r[player.id] for r in results) for player in self.players}
+
+        if seed is not None:
+            seed_random(seed)
+        player_ids = [player.id for player in self.players]
+        stats = {player_id: 0 for player_id in player_ids}
+        play_round = self.round
+        for _ in range(nr_rounds):
+            for player_id, points in zip(player_ids, play_round()):
+                stats[player_id] += points
+        return stats
+
+def _play_rounds(take5 : Take5, nr_rounds : int, seed : int) -> dict:
+    # seeding with None draws fresh entropy for this worker
+    seed_random(seed)
+    return take5.tournament(nr_rounds)
 
 if __name__ == "__main__":
     NR_ROUNDS = 10000
@@ -343,18 +642,14 @@ if __name__ == "__main__":
         # RandomPlayer('randbot 1'),
         # RandomPlayer('randbot 2'),
         # RandomPlayer('randbot 3'),
+        # LookaheadPlayer('lookbot', num_players=4, depth=1),
         CostFunPlayer('martijnbot 1', num_players=4, alpha=0.3),
         ShortestRowPlayer('martijnbot 2'),
         DescendingPlayer('martijnbot 3'),
         SmallestGapPlayer('martijnbot 4'),
     ]
     take5 = Take5(players, quiet=True)
-    stats = dict()
-    for round in range(NR_ROUNDS):
-        round_stats = take5.round()
-        stats = {p.id: stats.get(p.id, 0) + round_stats.get(p.id, 0) for p in players}
-        for player in players:
-            player.clear_points()
+    stats = take5.tournament(NR_ROUNDS, processes=cpu_count())
 
     print(f"Point totals after {NR_ROUNDS} rounds:")
     for player in players: